@@ -1,8 +1,5 @@
-from fastapi import FastAPI
-from src.blog_posts.hackmd import router as blog_router
-
-app = FastAPI()
-app.include_router(blog_router)
+import uvicorn
+from src.main import app
 
 if __name__ == "__main__":
-    app.run("main:app", host="0.0.0.0", port=4050, reload=True)
\ No newline at end of file
+    uvicorn.run("src.main:app", host="0.0.0.0", port=4050, loop="uvloop", http="httptools", reload=True)
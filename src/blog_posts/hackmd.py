@@ -1,17 +1,48 @@
 import os
-import json
+import gzip
+import asyncio
+import hashlib
 from typing import List, Optional, Any
-import requests
+import aiohttp
+import orjson
 from pathlib import Path
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from dotenv import load_dotenv
-from fastapi import HTTPException, APIRouter, Header, Depends
+from fastapi import HTTPException, APIRouter, Header, Depends, Response
 
 load_dotenv()
 
 HACKMD_API_URL = 'https://api.hackmd.io/v1'
+HACKMD_API_KEY = os.getenv("HACKMD_API_KEY")
+AUTH_HEADERS = {"Authorization": f"Bearer {HACKMD_API_KEY}"}
+CACHE_PATH = Path("data/notes_cache.json.gz")
 router = APIRouter()
 
+# Process-wide cache of the parsed notes list, keyed on the cache file's
+# mtime so an on-disk refresh invalidates it automatically.
+_CACHE: dict = {"mtime": 0.0, "posts": None, "by_slug": {}, "raw": None, "etag": None}
+
+# Shared aiohttp session so TCP/TLS connections to api.hackmd.io are
+# reused across requests. Created lazily (needs a running event loop)
+# and closed from the app's lifespan handler.
+_session: aiohttp.ClientSession | None = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared aiohttp session on application shutdown."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 
 
 class BlogPost(BaseModel):
@@ -38,38 +69,77 @@ class BlogPost(BaseModel):
     slug: str
     coverImage: str | None = None
     readingTime: str | None = None
-    
-def health_check(api_key: str) -> Any:
+
+# Precompiled validator for the cache payload; validate_json parses and
+# validates in a single pass instead of json-then-model construction.
+_POSTS_ADAPTER = TypeAdapter(List[BlogPost])
+_POST_ADAPTER = TypeAdapter(BlogPost)
+
+
+async def health_check(api_key: str) -> Any:
     url = f"{HACKMD_API_URL}/me"
     headers = {"Authorization": f"Bearer {api_key}"}
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return json.loads(response.text)
-    return HTTPException(response.status_code, response.text)
+    session = await get_session()
+    async with session.get(url, headers=headers) as response:
+        if response.status == 200:
+            return await response.json(loads=orjson.loads)
+        return HTTPException(response.status, await response.text())
+
+def _index_posts(posts: List[BlogPost], mtime: float, raw: bytes) -> None:
+    """
+    Store parsed posts in the in-process cache and rebuild the slug index.
+
+    Args:
+        posts: Parsed blog posts to cache
+        mtime: Cache file mtime the posts were parsed from
+        raw: Uncompressed JSON payload the posts serialize to
+    """
+    _CACHE["mtime"] = mtime
+    _CACHE["posts"] = posts
+    _CACHE["by_slug"] = {post.slug: post for post in posts}
+    _CACHE["raw"] = raw
+    # RFC 7232 entity-tags are quoted strings.
+    _CACHE["etag"] = f'"{hashlib.sha256(raw).hexdigest()[:16]}"'
 
 def get_from_cache() -> List[BlogPost] | None:
     """
     Retrieve blog notes from the local cache file.
-    
+
+    Parsed notes are memoized in-process and only re-read from disk when
+    the cache file's mtime changes.
+
     Returns:
         List[BlogPost]: List of cached blog notes if cache exists
         None: If cache doesn't exist or is invalid
     """
-    cache_path = Path("data/notes_cache.json")
-    if cache_path.exists():
-        return [BlogPost(**post) for post in json.loads(cache_path.read_text())]
-    return None
+    if not CACHE_PATH.exists():
+        return None
+    mtime = CACHE_PATH.stat().st_mtime
+    if _CACHE["posts"] is not None and _CACHE["mtime"] == mtime:
+        return _CACHE["posts"]
+    raw = gzip.decompress(CACHE_PATH.read_bytes())
+    posts = _POSTS_ADAPTER.validate_json(raw)
+    _index_posts(posts, mtime, raw)
+    return posts
 
 def save_to_cache(notes: List[BlogPost]) -> None:
     """
     Save blog notes to the local cache file.
-    
+
+    The in-memory cache is updated in the same pass (write-through), so
+    the next read doesn't have to re-parse what was just written. The
+    file is written to a temp path and swapped in with os.replace so
+    readers never see a half-written cache.
+
     Args:
         notes: List of BlogPost objects to cache
     """
-    cache_path = Path("data/notes_cache.json")
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps([post.dict() for post in notes]))
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    raw = _POSTS_ADAPTER.dump_json(notes)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_bytes(gzip.compress(raw, compresslevel=1))
+    os.replace(tmp_path, CACHE_PATH)
+    _index_posts(notes, CACHE_PATH.stat().st_mtime, raw)
 
 def transform_note(post: dict) -> BlogPost:
     """
@@ -81,59 +151,92 @@ def transform_note(post: dict) -> BlogPost:
     Returns:
         BlogPost: Transformed blog post
     """
-    return BlogPost(
-        id=post["id"],
-        title=post["title"],
-        content=post.get("content", ""),
-        publishDate=post.get("publishedAt", post.get("createdAt", "")),
-        lastModified=post.get("lastChangedAt", ""),
-        excerpt=post.get("excerpt") or post.get("content", "")[:200] + "...",
-        slug=post.get("permalink") or post.get("shortId", ""),
-        coverImage=post.get("coverImage"),
-        readingTime=post.get("readingTime")
-    )
+    return _POST_ADAPTER.validate_python({
+        "id": post["id"],
+        "title": post["title"],
+        "content": post.get("content", ""),
+        "publishDate": post.get("publishedAt", post.get("createdAt", "")),
+        "lastModified": post.get("lastChangedAt", ""),
+        "excerpt": post.get("excerpt") or post.get("content", "")[:200] + "...",
+        "slug": post.get("permalink") or post.get("shortId", ""),
+        "coverImage": post.get("coverImage"),
+        "readingTime": post.get("readingTime"),
+    })
+
+async def fetch_note_detail(session: aiohttp.ClientSession, short_id: str, headers: dict) -> dict:
+    """
+    Fetch the full content of a single note from the HackMD API.
+
+    Args:
+        session: Shared aiohttp session
+        short_id: HackMD short identifier of the note
+        headers: Request headers including authorization
+
+    Returns:
+        dict: Raw note data from the HackMD API
+    """
+    async with session.get(f"{HACKMD_API_URL}/notes/{short_id}", headers=headers) as response:
+        response.raise_for_status()
+        return await response.json(loads=orjson.loads)
+
+async def _fetch_and_cache_notes() -> List[BlogPost]:
+    """
+    Fetch all notes from the HackMD API and write them through the cache.
+
+    Returns:
+        List[BlogPost]: Freshly fetched blog notes
+
+    Raises:
+        HTTPException: If the API request fails
+    """
+    try:
+        session = await get_session()
+        async with session.get(f"{HACKMD_API_URL}/notes", headers=AUTH_HEADERS) as response:
+            response.raise_for_status()
+            note_list = await response.json(loads=orjson.loads)
+
+        # Fetch full content for all notes concurrently
+        tasks = [
+            fetch_note_detail(session, note["shortId"], AUTH_HEADERS)
+            for note in note_list
+        ]
+        posts = await asyncio.gather(*tasks)
+
+    except aiohttp.ClientError as err:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch blog notes: {err}")
+
+    transformed_notes = [transform_note(post) for post in posts]
+    save_to_cache(transformed_notes)
+    return transformed_notes
 
 @router.get("/notes", response_model=List[BlogPost])
-async def fetch_blog_notes():
+async def fetch_blog_notes(if_none_match: str | None = Header(default=None)):
     """
     Fetch all blog notes from cache or HackMD API.
-    
+
     Args:
-        api_key: Verified API key from header
-    
+        if_none_match: Optional ETag from the client's If-None-Match header
+
     Returns:
         List[BlogPost]: List of all blog notes
-        
+
     Raises:
         HTTPException: If API request fails or returns invalid data
     """
     try:
-        if cached_notes := get_from_cache():
-            return cached_notes
-
-        headers = {"Authorization": f"Bearer {os.getenv('HACKMD_API_KEY')}"}
+        if get_from_cache():
+            etag = _CACHE["etag"]
+            if if_none_match == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            # The cached payload is already the exact JSON the client
+            # needs; serve the bytes without revalidating or reserializing.
+            return Response(
+                content=_CACHE["raw"],
+                media_type="application/json",
+                headers={"ETag": etag, "Cache-Control": "public, max-age=60"},
+            )
 
-        try:
-            response = requests.get(f"{HACKMD_API_URL}/notes", headers=headers)
-            response.raise_for_status()
-            note_list = response.json()
-
-            # Fetch full content for each note
-            posts = []
-            for note in note_list:
-                detail_response = requests.get(
-                    f"{HACKMD_API_URL}/notes/{note['shortId']}", 
-                    headers=headers
-                )
-                detail_response.raise_for_status()
-                posts.append(detail_response.json())
-
-        except requests.exceptions.RequestException as err:
-            raise HTTPException(status_code=500, detail=f"Failed to fetch blog notes: {err}")
-
-        transformed_notes = [transform_note(post) for post in posts]
-        save_to_cache(transformed_notes)
-        return transformed_notes
+        return await _fetch_and_cache_notes()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch blog notes: {e}")
 
@@ -152,18 +255,16 @@ async def fetch_blog_post(slug: str):
     Raises:
         HTTPException: If post not found or API request fails
     """
-    if cached_notes := get_from_cache():
-        for post in cached_notes:
-            if post.slug == slug:
-                return post
-
-    headers = {"Authorization": f"Bearer {os.getenv('HACKMD_API_KEY')}"}
+    if get_from_cache():
+        if post := _CACHE["by_slug"].get(slug):
+            return post
 
     try:
-        response = requests.get(f"{HACKMD_API_URL}/notes/{slug}", headers=headers)
-        response.raise_for_status()
-        post = response.json()
-    except requests.exceptions.RequestException as err:
+        session = await get_session()
+        async with session.get(f"{HACKMD_API_URL}/notes/{slug}", headers=AUTH_HEADERS) as response:
+            response.raise_for_status()
+            post = await response.json(loads=orjson.loads)
+    except aiohttp.ClientError as err:
         raise HTTPException(status_code=500, detail=f"Failed to fetch blog post: {err}")
 
     return transform_note(post)
@@ -178,11 +279,8 @@ async def refresh_blog_notes():
     
     Returns:
         List[BlogPost]: Updated list of all blog notes
-        
+
     Raises:
         HTTPException: If refresh operation fails
     """
-    cache_path = Path("data/notes_cache.json")
-    if cache_path.exists():
-        cache_path.unlink()
-    return await fetch_blog_notes()
\ No newline at end of file
+    return await _fetch_and_cache_notes()
\ No newline at end of file
@@ -1,11 +1,19 @@
 import uvicorn
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from src.utils.static_manager import StaticManager
-from src.blog_posts.hackmd import router as blog_router
+from src.blog_posts.hackmd import router as blog_router, close_session
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_session()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 static_manager = StaticManager()
 
 app.add_middleware(
@@ -17,6 +25,8 @@ app.add_middleware(
     expose_headers=["*"], 
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 app.include_router(blog_router)
 
 @app.get("/api/backups")
@@ -25,4 +35,4 @@ async def list_backups(filename: str | None = None):
     return static_manager.list_backups(filename)
 
 if __name__ == "__main__":
-    uvicorn.run("src.main:app", host="0.0.0.0", port=4050, reload=True)
\ No newline at end of file
+    uvicorn.run("src.main:app", host="0.0.0.0", port=4050, loop="uvloop", http="httptools", reload=True)
\ No newline at end of file
@@ -1,9 +1,9 @@
 import os
 import json
+import time
 import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 from fastapi import HTTPException
 
 class StaticManager:
@@ -17,6 +17,7 @@ class StaticManager:
     def __init__(self, base_dir: str = "data"):
         self.base_dir = Path(base_dir)
         self.backup_dir = self.base_dir / "backups"
+        self._listing_cache: Dict[Path, tuple] = {}
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
@@ -91,55 +92,73 @@ class StaticManager:
         if not source_path.exists():
             raise HTTPException(status_code=404, detail=f"File {filename} not found")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"{filename.rsplit('.', 1)[0]}_{timestamp}.{filename.rsplit('.', 1)[1]}"
+        stem, _, ext = filename.rpartition('.')
+        # time_ns in hex: no strftime/tz lookup per call, and
+        # nanosecond resolution can't collide within a batch the way
+        # second-resolution stamps did.
+        stamp = format(time.time_ns(), 'x')
+        backup_filename = f"{stem}_{stamp}.{ext}"
         backup_path = self.backup_dir / backup_filename
 
         try:
-            shutil.copy2(source_path, backup_path)
+            shutil.copyfile(source_path, backup_path)
             return backup_path
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Backup failed: {str(e)}")
 
+    def _scan_dir(self, directory: Path) -> List[str]:
+        """
+        List filenames in a directory, memoized until its mtime changes.
+
+        Uses os.scandir so file-type checks come from the single
+        directory read instead of a stat call per entry.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            List[str]: List of filenames in the directory
+        """
+        mtime = directory.stat().st_mtime_ns
+        cached = self._listing_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+        self._listing_cache[directory] = (mtime, names)
+        return names
+
     def list_files(self, extension: Optional[str] = None) -> List[str]:
         """
         List all files in the static directory.
-        
+
         Args:
             extension: Optional file extension filter (e.g., 'json')
-            
+
         Returns:
             List[str]: List of filenames
         """
-        files = []
-        for file in self.base_dir.iterdir():
-            if file.is_file():
-                if extension:
-                    if file.suffix == f".{extension}":
-                        files.append(file.name)
-                else:
-                    files.append(file.name)
-        return files
+        names = self._scan_dir(self.base_dir)
+        if extension:
+            suffix = f".{extension}"
+            return [name for name in names if name.endswith(suffix)]
+        return list(names)
 
     def list_backups(self, original_filename: Optional[str] = None) -> List[str]:
         """
         List all backups, optionally filtered by original filename.
-        
+
         Args:
             original_filename: Optional original filename to filter backups
-            
+
         Returns:
             List[str]: List of backup filenames
         """
-        backups = []
-        for file in self.backup_dir.iterdir():
-            if file.is_file():
-                if original_filename:
-                    if file.name.startswith(original_filename.rsplit('.', 1)[0]):
-                        backups.append(file.name)
-                else:
-                    backups.append(file.name)
-        return backups
+        names = self._scan_dir(self.backup_dir)
+        if original_filename:
+            prefix = original_filename.rsplit('.', 1)[0]
+            return [name for name in names if name.startswith(prefix)]
+        return list(names)
 
     def delete_file(self, filename: str, create_backup: bool = True) -> None:
         """
@@ -1,7 +1,8 @@
 import os
 import json
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 class CodeCollector:
     """
@@ -13,54 +14,71 @@ class CodeCollector:
     """
     
     def __init__(self, output_file: str = 'code_collection.json'):
-        self.excluded_paths = [
+        self.excluded_paths = frozenset({
             'node_modules', 'venv', '.env', '.git',
-            'build', 'dist', '__pycache__', 
+            'build', 'dist', '__pycache__',
             '.pytest_cache', '.vscode', 'site-packages'
-        ]
+        })
         self.output_file = output_file
 
     def is_path_excluded(self, path: str) -> bool:
         """
         Check if path should be excluded based on patterns.
-        
+
         Args:
             path: Path to check
-            
+
         Returns:
             bool: True if path should be excluded
         """
-        return any(excluded in Path(path).parts for excluded in self.excluded_paths)
+        return not self.excluded_paths.isdisjoint(Path(path).parts)
 
     def collect_python_files(self, root_dir: str) -> Dict[str, str]:
         """
         Walk through directory and collect Python files.
-        
+
+        Excluded directories are pruned before descending, so subtrees
+        like node_modules or venv are never walked at all. File-type
+        checks reuse the DirEntry info from the directory read instead
+        of issuing a stat per entry. File contents are read on a thread
+        pool so the per-file I/O latency overlaps.
+
         Args:
             root_dir: Root directory to start walking from
-            
+
         Returns:
             Dict[str, str]: Dictionary mapping file paths to their content
         """
         root_path = Path(root_dir).resolve()
-        collected_files = {}
-        
-        for path in root_path.rglob('*.py'):
+        stack = [root_path]
+        paths: List[Path] = []
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.excluded_paths:
+                                stack.append(Path(entry.path))
+                        elif entry.name.endswith('.py') and entry.is_file():
+                            paths.append(Path(entry.path))
+            except OSError as e:
+                print(f"Error scanning {current}: {e}")
+
+        def read_file(path: Path) -> Optional[Tuple[str, str]]:
             try:
-                # Convert to relative path for checking exclusions
-                rel_path = path.relative_to(root_path)
-                
-                # Skip if path contains excluded patterns
-                if self.is_path_excluded(str(rel_path)):
-                    continue
-                
-                # Read file content
-                content = path.read_text(encoding='utf-8')
-                collected_files[str(rel_path)] = content
-                
+                return str(path.relative_to(root_path)), path.read_bytes().decode('utf-8')
             except Exception as e:
                 print(f"Error reading {path}: {e}")
-                        
+                return None
+
+        collected_files = {}
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for result in executor.map(read_file, paths):
+                if result is not None:
+                    collected_files[result[0]] = result[1]
+
         return collected_files
 
     def save_collection(self, collection: Dict[str, str]) -> None: